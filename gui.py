@@ -18,10 +18,16 @@ The GUI is built with tkinter and follows these design principles:
 - Proper state management during operations
 """
 
+import tkthread
+tkthread.patch()  # Must run before tkinter is imported so worker threads can call Tk directly
+
 import tkinter as tk
 from tkinter import ttk, scrolledtext, filedialog
-from transcribe import setup_whisper, transcribe_audio, MODELS
+from transcribe import (
+    setup_whisper, transcribe_audio, stream_transcription, count_windows, MODELS
+)
 import threading
+import queue
 import os
 
 class WhisperGUI:
@@ -101,8 +107,7 @@ class WhisperGUI:
             controls_frame,
             text="Select Audio File",
             command=self.select_file,
-            style='Action.TButton',
-            state='disabled'
+            style='Action.TButton'
         )
         self.select_button.grid(row=0, column=2, padx=(20, 0))
         
@@ -180,16 +185,30 @@ class WhisperGUI:
         root.columnconfigure(0, weight=1)
         root.rowconfigure(0, weight=1)
         
-        # Initialize pipeline
+        # Pipeline is loaded lazily on first file selection
         self.pipe = None
         self.current_model = 'small'
-        self.status_var.set("Initializing Whisper model...")
-        threading.Thread(target=self.initialize_pipeline).start()
+        self._loaded_model = None
+        self.status_var.set("Select a model and an audio file to begin")
         
         # Make text widget read-only by default
         self.output.config(state='disabled')
+        
+        # One persistent worker runs model loads and transcriptions in order,
+        # so a transcription can never start in the middle of a model switch
+        self._jobs = queue.Queue()
+        threading.Thread(target=self.worker_loop, daemon=True).start()
     
-    def initialize_pipeline(self):
+    def worker_loop(self):
+        """Run queued background jobs one at a time for the app's lifetime."""
+        while True:
+            job = self._jobs.get()
+            try:
+                job()
+            except Exception as e:  # Keep the worker alive for later jobs
+                print(f"Background job failed: {e}")
+    
+    def initialize_pipeline(self, on_ready=None):
         """
         Initialize or switch the Whisper model.
         
@@ -198,30 +217,39 @@ class WhisperGUI:
         - UI state during download
         - Error handling
         - Thread-safe UI updates
+        - Optional callback scheduled on the main loop once loaded
         """
         try:
             # Disable controls during initialization
-            self.root.after(0, lambda: [
+            tkthread.call_nosync(lambda: [
                 self.select_button.config(state='disabled'),
                 self.model_combo.config(state='disabled'),
                 self.status_var.set("Downloading model... This may take a few minutes..."),
                 self.progress.stop()  # Ensure progress bar is stopped during download
             ])
             
-            self.pipe = setup_whisper(self.current_model)
+            model_size = self.current_model
+            # Release our reference so an evicted pipeline can be freed before the load
+            self.pipe = None
+            self._loaded_model = None
+            self.pipe = setup_whisper(model_size)
+            self._loaded_model = model_size
             
             # Enable controls when ready
-            self.root.after(0, lambda: [
+            tkthread.call_nosync(lambda: [
                 self.select_button.config(state='normal'),
                 self.model_combo.config(state='readonly'),
                 self.status_var.set("Ready"),
                 self.progress.stop()  # Ensure progress bar is stopped
             ])
+            if on_ready:
+                tkthread.call_nosync(on_ready)
         except Exception as e:
-            self.root.after(0, lambda: [
-                self.select_button.config(state='disabled'),
+            error = str(e)  # `e` is unbound once the except block exits
+            tkthread.call_nosync(lambda: [
+                self.select_button.config(state='normal'),  # Allow retrying the load
                 self.model_combo.config(state='readonly'),
-                self.status_var.set(f"Error initializing: {str(e)}"),
+                self.status_var.set(f"Error initializing: {error}"),
                 self.progress.stop()  # Ensure progress bar is stopped
             ])
     
@@ -233,16 +261,21 @@ class WhisperGUI:
         - UI state during model switching
         - Progress indication
         - Thread-safe model initialization
+        - Deferred loading until a model is first needed
         """
         new_model = self.model_var.get()
         if new_model != self.current_model:
             self.current_model = new_model
+            if self.pipe is None:
+                # Nothing loaded yet; the model loads on first file selection
+                self.status_var.set(f"Selected {new_model} model")
+                return
             # Disable controls during model change
             self.select_button.config(state='disabled')
             self.model_combo.config(state='disabled')
             self.progress.stop()  # Stop progress during download
             self.status_var.set(f"Downloading {new_model} model... This may take a few minutes...")
-            threading.Thread(target=self.initialize_pipeline).start()
+            self._jobs.put(self.initialize_pipeline)
     
     def select_file(self):
         """
@@ -250,88 +283,237 @@ class WhisperGUI:
         
         Supports:
         - Multiple audio formats
+        - Selecting several files at once
         - Error checking
+        - Loading the selected model on first use
         - Immediate transcription start
         """
-        file_path = filedialog.askopenfilename(
+        file_paths = list(filedialog.askopenfilenames(
             filetypes=[
                 ("Audio Files", "*.mp3 *.wav *.m4a *.ogg"),
                 ("All Files", "*.*")
             ]
-        )
-        if file_path:
-            self.transcribe_file(file_path)
+        ))
+        if not file_paths:
+            return
+        if self.pipe is None or self._loaded_model != self.current_model:
+            # Load the selected model first, then chain the transcription
+            self._jobs.put(
+                lambda: self.initialize_pipeline(lambda: self.transcribe_files(file_paths))
+            )
+        else:
+            self.transcribe_files(file_paths)
+    
+    def insert_segments(self, segments, index=tk.END):
+        """
+        Insert tagged text into the output widget in a single insert.
+        
+        Takes a list of (text, tag) pairs; tag may be None. The text is
+        joined and inserted once at index (the end by default), then each
+        tag is applied to all of its ranges with one tag_add call, keeping
+        Tcl round-trips to O(#tags) instead of O(#segments). The widget
+        must already be writable.
+        """
+        base = self.output.index('end-1c' if index == tk.END else index)
+        parts = []
+        ranges = {}
+        offset = 0
+        for text, tag in segments:
+            parts.append(text)
+            if tag:
+                ranges.setdefault(tag, []).extend([
+                    f"{base} + {offset} chars",
+                    f"{base} + {offset + len(text)} chars"
+                ])
+            offset += len(text)
+        
+        self.output.insert(base, "".join(parts))
+        for tag, indices in ranges.items():
+            self.output.tag_add(tag, *indices)
+    
+    def chunk_segments(self, chunk):
+        """Build the (text, tag) segments for one timestamped chunk."""
+        timestamp = chunk["timestamp"]
+        if isinstance(timestamp, tuple):
+            start, end = timestamp
+            if end is None:  # Speech still running at the end of the audio
+                time_str = f"[{start:.2f}s -> ...]"
+            else:
+                time_str = f"[{start:.2f}s -> {end:.2f}s]"
+        else:
+            time_str = f"[{timestamp:.2f}s]"
+        
+        return [
+            (time_str + " ", 'timestamp'),
+            (chunk['text'].strip(), 'text'),
+            ("\n\n", None)  # Manual double spacing between chunks
+        ]
+    
+    def start_streamed_output(self):
+        """
+        Clear the output and lay out empty sections for a streamed transcription.
+        
+        A 'fulltext' mark with right gravity sits at the end of the full
+        transcription section so later text can be inserted there while
+        timestamped chunks are appended to the end of the widget.
+        """
+        self.output.config(state='normal')
+        self.output.delete(1.0, tk.END)
+        
+        head = [("Full Transcription:\n", 'header'), ("\n", None)]  # Manual spacing
+        self.insert_segments(head + [
+            ("\n\n\n", None),  # Manual spacing
+            ("Timestamped Chunks:\n", 'header'),
+            ("\n", None)  # Manual spacing
+        ])
+        self.output.mark_set('fulltext', f"1.0 + {sum(len(text) for text, _ in head)} chars")
+        self.output.mark_gravity('fulltext', tk.RIGHT)
+        self._fulltext_empty = True
+        
+        self.output.config(state='disabled')
+    
+    def append_chunk(self, result):
+        """Add one streamed window's text and timestamped chunks to the output."""
+        self.output.config(state='normal')
+        
+        text = result["text"].strip()
+        if text:
+            if not self._fulltext_empty:
+                text = " " + text
+            self.insert_segments([(text, 'text')], index='fulltext')
+            self._fulltext_empty = False
+        
+        segments = []
+        for chunk in result["chunks"]:
+            segments.extend(self.chunk_segments(chunk))
+        self.insert_segments(segments)
+        
+        self.output.config(state='disabled')
+        self.output.see(tk.END)
+        self.advance_progress()
     
-    def transcribe_file(self, file_path):
+    def start_progress(self, total=None):
+        """
+        Reset the progress bar for a new transcription.
+        
+        With a known number of steps the bar is determinate and advanced
+        by advance_progress; otherwise it falls back to an indeterminate
+        animation.
+        """
+        self.progress.stop()
+        if total:
+            self.progress.config(mode='determinate', maximum=total, value=0)
+        else:
+            self.progress.config(mode='indeterminate', value=0)
+            self.progress.start(10)
+    
+    def advance_progress(self):
+        """Mark one more step done on a determinate progress bar."""
+        if str(self.progress.cget('mode')) == 'determinate':
+            # Clamp rather than step(), which wraps around at the maximum
+            maximum = float(self.progress.cget('maximum'))
+            value = float(self.progress.cget('value'))
+            self.progress.config(value=min(value + 1, maximum))
+    
+    def finish_transcription(self):
+        """Return the UI to its idle state after a transcription."""
+        self.output.config(state='disabled')  # Make text widget read-only
+        self.progress.stop()
+        if str(self.progress.cget('mode')) == 'determinate':
+            self.progress.config(value=self.progress.cget('maximum'))
+        self.select_button.config(state='normal')
+        self.status_var.set("Transcription complete")
+    
+    def transcribe_files(self, file_paths):
         """
         Manage the transcription process.
         
         Features:
+        - Streamed output for a single file, window by window
+        - Batched transcription of several files
         - Progress indication
         - Thread-safe UI updates
         - Error handling
         - Formatted output with timestamps
         - State management during processing
         """
-        if not os.path.exists(file_path):
-            self.status_var.set("Error: File not found")
+        missing = [path for path in file_paths if not os.path.exists(path)]
+        if missing:
+            self.status_var.set(f"Error: File not found: {os.path.basename(missing[0])}")
             return
+        
+        if len(file_paths) == 1:
+            description = os.path.basename(file_paths[0])
+        else:
+            description = f"{len(file_paths)} files"
             
         def transcribe():
             try:
+                # A single streamed file reports real progress, one step per window
+                total = count_windows(file_paths[0]) if len(file_paths) == 1 else None
+                
                 # Disable button and start progress without clearing text yet
-                self.root.after(0, lambda: [
+                tkthread.call_nosync(lambda: [
                     self.select_button.config(state='disabled'),
-                    self.status_var.set(f"Transcribing {os.path.basename(file_path)}..."),
-                    self.progress.start(10)
+                    self.status_var.set(f"Transcribing {description}..."),
+                    self.start_progress(total)
                 ])
                 
-                result = transcribe_audio(file_path, self.pipe)
+                if len(file_paths) == 1:
+                    # Show each 30-second window as soon as it is transcribed
+                    tkthread.call_nosync(self.start_streamed_output)
+                    for result in stream_transcription(file_paths[0], self.pipe):
+                        tkthread.call_nosync(self.append_chunk, result)
+                    tkthread.call_nosync(self.finish_transcription)
+                    return
+                
+                # Several files go through the pipeline as a single batched call
+                results = transcribe_audio(file_paths, self.pipe)
+                if results is None:
+                    # transcribe_audio has already printed the underlying error
+                    raise RuntimeError("Transcription failed, see the console for details")
                 
                 def update_output():
                     try:
                         self.output.config(state='normal')
                         self.output.delete(1.0, tk.END)
                         
-                        if result:
+                        # Collect (text, tag) segments, then insert them in one go
+                        segments = []
+                        for file_path, result in zip(file_paths, results or []):
+                            # Label each file's section
+                            segments.append((f"=== {os.path.basename(file_path)} ===\n", 'header'))
+                            segments.append(("\n", None))  # Manual spacing
+                            
                             # Add full transcription
-                            self.output.insert(tk.END, "Full Transcription:\n", 'header')
-                            self.output.insert(tk.END, "\n")  # Manual spacing
-                            self.output.insert(tk.END, result["text"].strip(), 'text')
-                            self.output.insert(tk.END, "\n\n\n")  # Manual spacing
+                            segments.append(("Full Transcription:\n", 'header'))
+                            segments.append(("\n", None))  # Manual spacing
+                            segments.append((result["text"].strip(), 'text'))
+                            segments.append(("\n\n\n", None))  # Manual spacing
                             
                             # Add timestamped chunks
-                            self.output.insert(tk.END, "Timestamped Chunks:\n", 'header')
-                            self.output.insert(tk.END, "\n")  # Manual spacing
+                            segments.append(("Timestamped Chunks:\n", 'header'))
+                            segments.append(("\n", None))  # Manual spacing
                             
                             for chunk in result["chunks"]:
-                                timestamp = chunk["timestamp"]
-                                if isinstance(timestamp, tuple):
-                                    start, end = timestamp
-                                    time_str = f"[{start:.2f}s -> {end:.2f}s]"
-                                else:
-                                    time_str = f"[{timestamp:.2f}s]"
-                                
-                                self.output.insert(tk.END, time_str + " ", 'timestamp')
-                                self.output.insert(tk.END, chunk['text'].strip(), 'text')
-                                self.output.insert(tk.END, "\n\n")  # Manual double spacing between chunks
+                                segments.extend(self.chunk_segments(chunk))
+                        
+                        self.insert_segments(segments)
                     finally:
                         # Always make text widget read-only and update UI state
-                        self.output.config(state='disabled')  # Make text widget read-only
-                        self.progress.stop()
-                        self.select_button.config(state='normal')
-                        self.status_var.set("Transcription complete")
+                        self.finish_transcription()
                 
-                self.root.after(0, update_output)
+                tkthread.call_nosync(update_output)
                 
             except Exception as e:
+                error = str(e)  # `e` is unbound once the except block exits
                 def handle_error():
                     self.progress.stop()
                     self.select_button.config(state='normal')
-                    self.status_var.set(f"Error: {str(e)}")
-                self.root.after(0, handle_error)
+                    self.status_var.set(f"Error: {error}")
+                tkthread.call_nosync(handle_error)
         
-        threading.Thread(target=transcribe).start()
+        self._jobs.put(transcribe)
 
 def main():
     root = tk.Tk()
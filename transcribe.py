@@ -1,8 +1,32 @@
+import os
+
+# Let the CUDA caching allocator grow segments in place so blocks are reused
+# across transcriptions instead of being cudaMalloc'd/freed each call.
+# Must be set before torch initializes CUDA.
+os.environ.setdefault(
+    "PYTORCH_CUDA_ALLOC_CONF", "expandable_segments:True,max_split_size_mb:512"
+)
+
+import diskcache
+from huggingface_hub import snapshot_download
+import numpy as np
+import soundfile as sf
 import torch
+import torchaudio.functional as F
 from transformers import AutoModelForSpeechSeq2Seq, AutoProcessor, pipeline
-import os
+from transformers.pipelines.audio_utils import ffmpeg_read
 import warnings
 import argparse
+import platform
+import sys
+import gc
+import hashlib
+import io
+import itertools
+import math
+import subprocess
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 
 # Add these constants at the top
 MODELS = {
@@ -10,73 +34,526 @@ MODELS = {
     'base': "openai/whisper-base",        # 74M parameters
     'small': "openai/whisper-small",      # 244M parameters
     'medium': "openai/whisper-medium",    # 769M parameters
-    'large': "openai/whisper-large-v3-turbo"  # 809M parameters
+    'large': "openai/whisper-large-v3-turbo",  # 809M parameters
+    # English-only variants, no language-id tokens to predict
+    'tiny.en': "openai/whisper-tiny.en",        # 39M parameters
+    'base.en': "openai/whisper-base.en",        # 74M parameters
+    'small.en': "openai/whisper-small.en",      # 244M parameters
+    'medium.en': "openai/whisper-medium.en"     # 769M parameters
 }
 
 MODEL_DIR = "models"  # Local directory to store models
 
+SAMPLING_RATE = 16000  # Whisper expects 16kHz mono audio
+CHUNK_SECONDS = 30  # Whisper's fixed input window
+STRIDE_SECONDS = 5  # Overlap on each side of a chunk for stitching
+
+BATCH_SIZE = 8  # Default chunks per forward pass (CPU or unknown model)
+MAX_BATCH_SIZE = 32  # Upper bound when sizing batches from free VRAM
+
+# Rough fp16 VRAM needed per 30s chunk in a batch (activations + KV cache), in MB.
+# English-only variants share the numbers of their multilingual size.
+CHUNK_MEMORY_MB = {
+    'tiny': 40,
+    'base': 60,
+    'small': 150,
+    'medium': 300,
+    'large': 200  # large-v3-turbo has only 4 decoder layers
+}
+
+DECODE_WORKERS = 2  # Background threads decoding audio while the model runs
+
+RESULT_CACHE_DIR = ".transcribe_cache"  # On-disk cache of finished transcriptions
+RESULT_CACHE_SIZE = 2 << 30  # 2GB limit before the oldest results are culled
+
+GPU_MEMORY_FRACTION = 0.9  # Cap on the share of VRAM the allocator may use
+
+PIPE_CACHE_SIZE = 2  # Number of loaded pipelines kept in memory
+
+# Already-built pipelines keyed by model id, least recently used first
+_PIPE_CACHE = OrderedDict()
+
+# Processors shared between Whisper sizes, keyed by (mel bins, vocab size).
+# tiny through medium use the same tokenizer and mel filterbank.
+_PROCESSOR_CACHE = {}
+
+# Opened lazily by _result_cache()
+_RESULT_CACHE = None
+
+# Set once the GPU memory cap has been applied by _cap_gpu_memory()
+_GPU_MEMORY_CAPPED = False
+
+def _evict_pipelines(max_size):
+    """Drop least recently used pipelines until at most max_size remain"""
+    while len(_PIPE_CACHE) > max_size:
+        _, pipe = _PIPE_CACHE.popitem(last=False)
+        model = pipe.model
+        # The static KV cache holds plain GPU tensors that .to() doesn't move
+        if hasattr(model, "_cache"):
+            del model._cache
+        # Drop the compiled forward, which references the model in a cycle
+        model.__dict__.pop("forward", None)
+        model.to("cpu")
+        del pipe, model
+        gc.collect()  # Break remaining cycles so the tensors are actually freed
+        if torch.cuda.is_available():
+            torch.cuda.empty_cache()
+
+def _cap_gpu_memory():
+    """Cap the CUDA caching allocator at GPU_MEMORY_FRACTION of VRAM, once per process"""
+    global _GPU_MEMORY_CAPPED
+    if torch.cuda.is_available() and not _GPU_MEMORY_CAPPED:
+        torch.cuda.set_per_process_memory_fraction(GPU_MEMORY_FRACTION)
+        _GPU_MEMORY_CAPPED = True
+
+def _load_pretrained(loader, model_id, **kwargs):
+    """Load from the local model cache, only going to the hub if files are missing"""
+    try:
+        return loader(model_id, local_files_only=True, cache_dir=MODEL_DIR, **kwargs)
+    except OSError:
+        return loader(model_id, local_files_only=False, cache_dir=MODEL_DIR, **kwargs)
+
+def prefetch_models(model_sizes):
+    """Download model weights and processor files into MODEL_DIR ahead of time"""
+    os.makedirs(MODEL_DIR, exist_ok=True)
+    for model_size in model_sizes:
+        model_id = MODELS[model_size]
+        print(f"\nDownloading {model_size} model ({model_id})...")
+        # Fetch only configs, tokenizer files and safetensors weights, without building the model
+        snapshot_download(
+            model_id,
+            cache_dir=MODEL_DIR,
+            allow_patterns=["*.json", "*.txt", "*.safetensors"]
+        )
+    print("\nModels are ready for offline use")
+
+def _cpu_supports_bf16():
+    """Whether the CPU path should run in bfloat16 (Apple Silicon, AVX512-BF16/AMX)"""
+    if sys.platform == "darwin" and platform.machine() == "arm64":
+        return True
+    check = getattr(torch.cpu, "_is_avx512_bf16_supported", None)
+    return bool(check and check())
+
+def _quantize_for_cpu(model):
+    """Quantize Linear layers to int8, keeping the fp32 model if the platform can't"""
+    if torch.backends.quantized.engine == "none":
+        print("No quantized engine available, running in float32")
+        return model
+    try:
+        # Not in place, so a failure part-way leaves the fp32 model intact
+        return torch.ao.quantization.quantize_dynamic(
+            model, {torch.nn.Linear}, dtype=torch.qint8
+        )
+    except Exception as e:
+        print(f"int8 quantization failed, running in float32: {e}")
+        return model
+
+def _warmup_pipeline(pipe):
+    """Run silence through the pipeline to prime kernels, caches and compiled graphs.
+
+    Decoding uses the same generate options as real calls, so the static
+    KV cache is sized for Whisper's full max_length. Both batch shapes
+    real calls use are warmed: single windows for streaming and full
+    batches of _batch_size() chunks.
+    """
+    dummy = np.zeros(SAMPLING_RATE, dtype=np.float32)
+    generate_kwargs = _generate_kwargs(pipe)
+    with torch.inference_mode():
+        for batch_size in sorted({1, _batch_size(pipe)}):
+            list(pipe(
+                [dummy] * batch_size,
+                batch_size=batch_size,
+                generate_kwargs=generate_kwargs
+            ))
+
 def setup_whisper(model_size='small'):  # Default to small for better speed
     # Filter out specific warnings
     warnings.filterwarnings("ignore", message="The input name `inputs` is deprecated")
     
+    # Reuse an already-loaded pipeline when switching back to a model
+    model_id = MODELS.get(model_size, MODELS['small'])
+    if model_id in _PIPE_CACHE:
+        _PIPE_CACHE.move_to_end(model_id)
+        print(f"\nUsing cached {model_size} model")
+        return _PIPE_CACHE[model_id]
+
+    # Make room first so loading a new model never holds more than
+    # PIPE_CACHE_SIZE models at once
+    _evict_pipelines(PIPE_CACHE_SIZE - 1)
+
+    # Bound the allocator before any weights land on the GPU; _batch_size
+    # sizes batches against the same cap
+    _cap_gpu_memory()
+
     # Set device and dtype
     device = "cuda:0" if torch.cuda.is_available() else "cpu"
     print(f"Using device: {device}")
-    torch_dtype = torch.float16 if torch.cuda.is_available() else torch.float32
+    if torch.cuda.is_available():
+        torch_dtype = torch.float16
+    elif _cpu_supports_bf16():
+        torch_dtype = torch.bfloat16
+    else:
+        torch_dtype = torch.float32  # Quantized to int8 after loading
 
     # Create models directory if it doesn't exist
     os.makedirs(MODEL_DIR, exist_ok=True)
 
-    # Load model with optimizations, saving to local directory
-    model_id = MODELS.get(model_size, MODELS['small'])
+    # Load model with optimizations, saving to local directory.
+    # device_map streams the mmap'd safetensors straight onto the target device.
     print(f"\nDownloading/Loading {model_size} model...")
-    model = AutoModelForSpeechSeq2Seq.from_pretrained(
+    model = _load_pretrained(
+        AutoModelForSpeechSeq2Seq.from_pretrained,
         model_id, 
         torch_dtype=torch_dtype,
         low_cpu_mem_usage=True,
         use_safetensors=True,
-        local_files_only=False,
-        cache_dir=MODEL_DIR
+        device_map={"": device},
+        # SDPA rather than Flash-Attention 2, which rejects the static cache below
+        attn_implementation="sdpa"
     )
     print(f"Model loaded successfully!")
-    model.to(device)
+    model.eval()
 
-    # Load processor
-    processor = AutoProcessor.from_pretrained(
-        model_id,
-        local_files_only=False,
-        cache_dir=MODEL_DIR
-    )
+    # Without bf16 support, int8 dynamic quantization halves CPU memory traffic
+    if torch_dtype == torch.float32:
+        model = _quantize_for_cpu(model)
 
-    # Create pipeline
+    # Static KV cache + compiled forward cut per-step decoder overhead on GPU
+    eager_forward = None
+    if torch.cuda.is_available():
+        model.generation_config.cache_implementation = "static"
+        try:
+            # dynamic=False: each batch shape gets its own specialized graph
+            compiled_forward = torch.compile(
+                model.forward, mode="reduce-overhead", fullgraph=False, dynamic=False
+            )
+        except Exception as e:  # e.g. Dynamo unsupported on this Python version
+            print(f"torch.compile unavailable, running eagerly: {e}")
+        else:
+            eager_forward = model.forward
+            model.forward = compiled_forward
+
+    # Load processor, reusing one from another size with the same vocab and features
+    processor_key = (model.config.num_mel_bins, model.config.vocab_size)
+    processor = _PROCESSOR_CACHE.get(processor_key)
+    if processor is None:
+        processor = _load_pretrained(AutoProcessor.from_pretrained, model_id)
+        _PROCESSOR_CACHE[processor_key] = processor
+
+    # Create pipeline (the device comes from the model's device_map).
+    # Chunking and timestamp options are fixed here once rather than per call.
     pipe = pipeline(
         "automatic-speech-recognition",
         model=model,
         tokenizer=processor.tokenizer,
         feature_extractor=processor.feature_extractor,
         torch_dtype=torch_dtype,
-        device=device,
+        return_timestamps=True,
+        chunk_length_s=CHUNK_SECONDS,  # Process 30-second chunks
+        stride_length_s=STRIDE_SECONDS,  # 5-second overlap between chunks
     )
 
+    # Pay kernel selection / graph capture cost now, not on the first real file
+    print("Warming up model...")
+    try:
+        _warmup_pipeline(pipe)
+    except Exception as e:
+        if eager_forward is None:
+            raise
+        # Compilation only fails on first call, e.g. Windows without Triton
+        print(f"torch.compile failed, falling back to eager mode: {e}")
+        model.forward = eager_forward
+        _warmup_pipeline(pipe)
+
+    _PIPE_CACHE[model_id] = pipe
+    _evict_pipelines(PIPE_CACHE_SIZE)  # Safety net
+
     return pipe
 
-def transcribe_audio(audio_path, pipeline):
-    """Transcribe an audio file using Whisper"""
-    try:
-        # Transcribe with timestamps and chunking
-        result = pipeline(
-            audio_path, 
-            return_timestamps=True,
-            chunk_length_s=30,  # Process 30-second chunks
-            stride_length_s=5,  # 5-second overlap between chunks
-            batch_size=8,      # Process multiple chunks in parallel
-            generate_kwargs={
-                "language": "english",
-                "task": "transcribe",
-                "forced_decoder_ids": None
-            }
+def _prepare_audio(audio):
+    """Turn a path, encoded bytes or a PCM array into a pipeline input"""
+    if isinstance(audio, (bytes, bytearray)):
+        audio = io.BytesIO(audio)
+    if isinstance(audio, io.BytesIO):
+        # Decode in memory instead of round-tripping through ffmpeg
+        try:
+            data, sampling_rate = sf.read(audio, dtype='float32')
+        except RuntimeError:  # sf.LibsndfileError, e.g. m4a or mp3 on old libsndfile
+            data = ffmpeg_read(audio.getvalue(), SAMPLING_RATE)
+            return {"array": data, "sampling_rate": SAMPLING_RATE}
+        if data.ndim > 1:
+            data = data.mean(axis=1)  # Downmix to mono
+        return {"array": data, "sampling_rate": sampling_rate}
+    if isinstance(audio, np.ndarray):
+        # Already-decoded PCM is assumed to be 16kHz mono
+        return {"array": audio, "sampling_rate": SAMPLING_RATE}
+    return audio
+
+def _decode_input(item):
+    """Decode one pipeline input to 16kHz PCM, ready for the pipeline"""
+    if isinstance(item, str):
+        with open(item, 'rb') as f:
+            data = ffmpeg_read(f.read(), SAMPLING_RATE)
+        return {"array": data, "sampling_rate": SAMPLING_RATE}
+    return _prepare_audio(item)
+
+def _decoded_inputs(items):
+    """Yield decoded inputs in order, decoding the next ones on background threads.
+
+    ffmpeg_read runs ffmpeg in a subprocess, so threads are enough to
+    overlap decoding with inference without starting worker processes.
+    """
+    with ThreadPoolExecutor(max_workers=DECODE_WORKERS) as executor:
+        remaining = iter(items)
+        pending = deque(
+            executor.submit(_decode_input, item)
+            for item in itertools.islice(remaining, DECODE_WORKERS * 2)
         )
-        return result
+        while pending:
+            sample = pending.popleft().result()
+            for item in itertools.islice(remaining, 1):
+                pending.append(executor.submit(_decode_input, item))
+            yield sample
+
+def _result_cache():
+    """Open the on-disk transcription cache on first use"""
+    global _RESULT_CACHE
+    if _RESULT_CACHE is None:
+        _RESULT_CACHE = diskcache.Cache(RESULT_CACHE_DIR, size_limit=RESULT_CACHE_SIZE)
+    return _RESULT_CACHE
+
+def _audio_digest(audio):
+    """Hash the raw bytes of a path, encoded buffer or PCM array"""
+    if isinstance(audio, str):
+        with open(audio, 'rb') as f:
+            data = f.read()
+    elif isinstance(audio, io.BytesIO):
+        data = audio.getvalue()
+    elif isinstance(audio, np.ndarray):
+        data = audio.tobytes()
+    else:
+        data = bytes(audio)
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+def _load_pcm(audio):
+    """Decode an in-memory input (bytes/BytesIO/array) to a 16kHz mono float32 array"""
+    sample = _prepare_audio(audio)
+    data, sampling_rate = sample["array"], sample["sampling_rate"]
+    if sampling_rate != SAMPLING_RATE:
+        data = F.resample(torch.from_numpy(data), sampling_rate, SAMPLING_RATE).numpy()
+    return data
+
+def _pcm_windows(audio):
+    """Yield consecutive CHUNK_SECONDS windows of 16kHz mono float32 PCM.
+
+    Files are decoded incrementally by an ffmpeg pipe, with the next
+    windows read ahead on a background thread so decoding overlaps
+    inference. In-memory inputs are decoded once and sliced.
+    """
+    window = CHUNK_SECONDS * SAMPLING_RATE
+    if not isinstance(audio, str):
+        data = _load_pcm(audio)
+        for start in range(0, len(data), window):
+            yield data[start:start + window]
+        return
+
+    command = [
+        "ffmpeg", "-hide_banner", "-loglevel", "error", "-i", audio,
+        "-ac", "1", "-ar", str(SAMPLING_RATE), "-f", "f32le", "pipe:1"
+    ]
+    try:
+        process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    except FileNotFoundError:
+        raise ValueError("ffmpeg was not found but is required to load audio files") from None
+
+    def read_window():
+        return np.frombuffer(process.stdout.read(window * 4), dtype='<f4')
+
+    try:
+        # One reader thread keeps reads in order; DECODE_WORKERS windows stay queued
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            pending = deque(executor.submit(read_window) for _ in range(DECODE_WORKERS))
+            while True:
+                data = pending.popleft().result()
+                if not data.size:
+                    break
+                pending.append(executor.submit(read_window))
+                yield data
+        if process.wait() != 0:
+            error = process.stderr.read().decode(errors='replace').strip()
+            raise ValueError(f"ffmpeg could not decode {audio}: {error}")
+    finally:
+        process.kill()
+        process.wait()
+        process.stdout.close()
+        process.stderr.close()
+
+def _generate_kwargs(pipeline):
+    """Decoding options passed to Whisper's generate()"""
+    if not getattr(pipeline.model.generation_config, "is_multilingual", True):
+        # English-only (.en) models reject language/task options
+        return {}
+    return {
+        "language": "english",
+        "task": "transcribe",
+        "forced_decoder_ids": None
+    }
+
+def _result_key(audio, pipeline, generate_kwargs, mode="stitched"):
+    """Cache key for one input transcribed by a pipeline with given options.
+
+    mode separates stride-stitched transcripts from streamed windowed ones,
+    which can split words at window boundaries.
+    """
+    options = repr(sorted(generate_kwargs.items()))
+    return f"{_audio_digest(audio)}:{pipeline.model.name_or_path}:{mode}:{options}"
+
+def _batch_size(pipeline):
+    """Pick how many chunks to batch, fitting the free VRAM on GPU.
+
+    Free memory is the smaller of what the GPU_MEMORY_FRACTION cap leaves
+    after live tensors and what the device actually has free (which
+    accounts for other processes and the CUDA context); blocks cached by
+    the allocator count as available in both. The result is rounded down
+    to a power of two so small swings in free memory between calls don't
+    change the batch shape.
+    """
+    if not torch.cuda.is_available():
+        return BATCH_SIZE
+    model_id = pipeline.model.name_or_path
+    sizes = [name for name, mid in MODELS.items() if mid == model_id]
+    per_chunk_mb = CHUNK_MEMORY_MB.get(sizes[0].split('.')[0]) if sizes else None
+    if per_chunk_mb is None:
+        return BATCH_SIZE
+    device_free, device_total = torch.cuda.mem_get_info()
+    allocated = torch.cuda.memory_allocated()
+    cached = torch.cuda.memory_reserved() - allocated
+    free_bytes = min(int(GPU_MEMORY_FRACTION * device_total) - allocated, device_free + cached)
+    batch_size = min(MAX_BATCH_SIZE, max(1, free_bytes // (per_chunk_mb << 20)))
+    return 1 << (int(batch_size).bit_length() - 1)
+
+def _chunk_count(sample):
+    """Number of chunks the pipeline's chunk iterator cuts a decoded sample into"""
+    length = math.ceil(len(sample["array"]) * SAMPLING_RATE / sample["sampling_rate"])
+    if length == 0:
+        return 0
+    chunk = CHUNK_SECONDS * SAMPLING_RATE
+    step = chunk - 2 * STRIDE_SECONDS * SAMPLING_RATE
+    return 1 + max(0, math.ceil((length - chunk) / step))
+
+def _pad_to_full_batches(samples, batch_size):
+    """Yield samples, then silent one-chunk fillers so the last batch is full.
+
+    The compiled forward is specialized per batch shape, so padding the
+    tail keeps every batched call on the single warmed-up shape instead
+    of compiling a new graph for each leftover size.
+    """
+    chunks = 0
+    for sample in samples:
+        chunks += _chunk_count(sample)
+        yield sample
+    for _ in range(-chunks % batch_size):
+        yield {"array": np.zeros(SAMPLING_RATE, dtype=np.float32), "sampling_rate": SAMPLING_RATE}
+
+def _shift_timestamp(timestamp, offset):
+    """Move a (start, end) chunk timestamp by offset seconds"""
+    return tuple(None if t is None else t + offset for t in timestamp)
+
+def count_windows(audio_path):
+    """Number of windows stream_transcription yields for a file, or None if unknown"""
+    try:
+        duration = sf.info(audio_path).duration
+    except RuntimeError:  # Format soundfile can't read without decoding (e.g. m4a)
+        return None
+    return max(1, math.ceil(duration / CHUNK_SECONDS))
+
+def stream_transcription(audio, pipeline):
+    """Transcribe audio window by window, yielding each result as it finishes.
+
+    The audio is split into consecutive CHUNK_SECONDS windows that are
+    decoded just ahead of and transcribed one at a time, so callers can
+    show text long before the whole file is decoded or transcribed. Chunk timestamps are relative to the start of the
+    audio. A cached streamed transcription is yielded as a single result.
+    """
+    generate_kwargs = _generate_kwargs(pipeline)
+    cache = _result_cache()
+    key = _result_key(audio, pipeline, generate_kwargs, mode="stream")
+    cached = cache.get(key)
+    if cached is not None:
+        yield cached
+        return
+
+    windows = (
+        {"array": data, "sampling_rate": SAMPLING_RATE}
+        for data in _pcm_windows(audio)
+    )
+
+    results = iter(pipeline(
+        windows,
+        batch_size=1,
+        generate_kwargs=generate_kwargs
+    ))
+    texts = []
+    chunks = []
+    for index in itertools.count():
+        # Only the model call runs in inference mode, not the caller between windows
+        with torch.inference_mode():
+            result = next(results, None)
+        if result is None:
+            break
+        offset = index * CHUNK_SECONDS
+        result = {
+            "text": result["text"],
+            "chunks": [
+                {**chunk, "timestamp": _shift_timestamp(chunk["timestamp"], offset)}
+                for chunk in result["chunks"]
+            ]
+        }
+        texts.append(result["text"])
+        chunks.extend(result["chunks"])
+        yield result
+
+    cache.set(key, {"text": "".join(texts), "chunks": chunks})
+
+def transcribe_audio(audio, pipeline):
+    """Transcribe audio using Whisper.
+
+    audio may be a file path, encoded audio as bytes/BytesIO, or a
+    16kHz mono float32 numpy array. Passing a list of these transcribes
+    them in one batched pipeline call and returns a list of results.
+    Results are cached on disk by audio content, model and decoding options.
+    """
+    items = audio if isinstance(audio, list) else [audio]
+    generate_kwargs = _generate_kwargs(pipeline)
+    try:
+        # Serve repeat requests from the cache, only transcribing the rest
+        cache = _result_cache()
+        keys = [_result_key(item, pipeline, generate_kwargs) for item in items]
+        results = [cache.get(key) for key in keys]
+        pending = [i for i, result in enumerate(results) if result is None]
+
+        if pending:
+            # Decode upcoming files on background threads while the GPU transcribes
+            inputs = _decoded_inputs([items[i] for i in pending])
+            batch_size = _batch_size(pipeline)
+            if "forward" in pipeline.model.__dict__:
+                # Compiled forward: keep the tail batch on the warmed-up shape
+                inputs = _pad_to_full_batches(inputs, batch_size)
+
+            # Transcribe with timestamps and chunking, skipping autograd bookkeeping.
+            # Chunks from every input share the same batches. Results come back in
+            # input order, and zip stops before any padding results.
+            with torch.inference_mode():
+                output = pipeline(
+                    inputs, 
+                    batch_size=batch_size,  # Process multiple chunks in parallel
+                    generate_kwargs=generate_kwargs
+                )
+                for i, result in zip(pending, output):
+                    cache.set(keys[i], result)
+                    results[i] = result
+
+        return results if isinstance(audio, list) else results[0]
     except Exception as e:
         print(f"Error transcribing audio: {e}")
         return None
@@ -90,25 +567,38 @@ def format_timestamp(timestamp):
 
 def main():
     parser = argparse.ArgumentParser()
-    parser.add_argument('--model', choices=MODELS.keys(), default='small',
-                       help='Model size to use')
-    parser.add_argument('--file', default='test_audio_file.mp3',
-                       help='Audio file to transcribe')
+    parser.add_argument('command', nargs='?', choices=['transcribe', 'prefetch'],
+                       default='transcribe',
+                       help='Transcribe audio (default) or only download models')
+    parser.add_argument('--model', choices=[*MODELS.keys(), 'all'], default='small',
+                       help="Model size to use ('all' is only valid for prefetch)")
+    parser.add_argument('--file', nargs='+', default=['test_audio_file.mp3'],
+                       help='Audio file(s) to transcribe')
     args = parser.parse_args()
     
+    if args.command == 'prefetch':
+        prefetch_models(MODELS.keys() if args.model == 'all' else [args.model])
+        return
+    if args.model == 'all':
+        parser.error("--model all can only be used with prefetch")
+    
     print(f"\nUsing {args.model} model...")
     pipe = setup_whisper(args.model)
     
-    result = transcribe_audio(args.file, pipe)
+    results = transcribe_audio(args.file, pipe)
     
-    if result:
-        print("\nTranscription:")
-        print(result["text"].strip())
-        
-        print("\nTimestamped chunks:")
-        for chunk in result["chunks"]:
-            timestamp = format_timestamp(chunk["timestamp"])
-            print(f"{timestamp} {chunk['text'].strip()}")
+    if results:
+        for file_path, result in zip(args.file, results):
+            if len(args.file) > 1:
+                print(f"\n=== {file_path} ===")
+
+            print("\nTranscription:")
+            print(result["text"].strip())
+            
+            print("\nTimestamped chunks:")
+            for chunk in result["chunks"]:
+                timestamp = format_timestamp(chunk["timestamp"])
+                print(f"{timestamp} {chunk['text'].strip()}")
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file